@@ -5,10 +5,141 @@ Uses multiple strategies to identify and remove duplicate content.
 
 import re
 import hashlib
-from typing import List, Dict, Set
+from functools import lru_cache
+from typing import List, Dict, Optional, Set, Tuple
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
 from difflib import SequenceMatcher
 
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:
+    fuzz = None
+    process = None
+
+# Precompiled patterns for _normalize_text (called for every title and hash)
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Lower value wins when the same story arrives from several sources
+_SOURCE_PRIORITY = {'NewsAPI': 1, 'Google News': 2, 'ChatGPT': 3}
+
+# Seen titles are grouped by len(title) // _TITLE_BUCKET_WIDTH for fuzzy matching
+_TITLE_BUCKET_WIDTH = 8
+
+# Query parameters that only track the click and never identify the article
+_TRACKING_PARAMS = frozenset({
+    'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content',
+    'fbclid', 'gclid', 'msclkid', 'ref', 'source', 'mc_cid', 'mc_eid',
+    '_ga', '_gl', 'ncid', 'sr_share', 'ocid', 'cvid', 'ei', 'oref'
+})
+
+# Characters _fast_normalize_url handles without urllib's quoting rules
+_NETLOC_CHARS = frozenset('abcdefghijklmnopqrstuvwxyz0123456789.-:')
+_PATH_CHARS = _NETLOC_CHARS | frozenset("/_~%!$&'()*+,=@")
+_QUERY_CHARS = frozenset('abcdefghijklmnopqrstuvwxyz0123456789.-_~=&')
+
+
+@lru_cache(maxsize=8192)
+def normalize_url(url: str) -> str:
+    """
+    Normalize URL to catch duplicates with different tracking parameters.
+    
+    Removes:
+    - Tracking parameters (utm_*, fbclid, etc.)
+    - Protocol differences (http vs https)
+    - Trailing slashes
+    - www prefix variations
+    
+    Results are memoized since sources often return the same links.
+    """
+    if not url:
+        return ""
+    
+    normalized = _fast_normalize_url(url.lower().strip())
+    if normalized is not None:
+        return normalized
+    
+    try:
+        # Parse URL
+        parsed = urlparse(url.lower().strip())
+        
+        # Remove tracking parameters
+        query_params = parse_qs(parsed.query)
+        filtered_params = {
+            k: v for k, v in query_params.items() 
+            if k.lower() not in _TRACKING_PARAMS
+        }
+        
+        # Reconstruct URL
+        clean_query = urlencode(filtered_params, doseq=True) if filtered_params else ''
+        
+        # Normalize domain (remove www.)
+        domain = parsed.netloc.replace('www.', '')
+        
+        # Remove trailing slash from path
+        path = parsed.path.rstrip('/')
+        
+        # Reconstruct normalized URL
+        normalized = urlunparse((
+            '',  # No protocol
+            domain,
+            path,
+            '',
+            clean_query,
+            ''  # No fragment
+        ))
+        
+        return normalized.strip('/')
+        
+    except Exception:
+        return url.lower().strip()
+
+
+def _fast_normalize_url(url: str) -> Optional[str]:
+    """
+    Single-pass normalize_url for plain http(s) URLs.
+    
+    Gives the same result as the urllib path using only str.partition, but
+    returns None for anything with characters urllib would parse or re-quote
+    differently (params, percent-escapes in the query, userinfo, IPv6, ...).
+    """
+    scheme, sep, rest = url.partition('://')
+    if not sep or scheme not in ('http', 'https'):
+        return None
+    
+    rest = rest.partition('#')[0]
+    rest, _, query = rest.partition('?')
+    netloc, slash, path = rest.partition('/')
+    path = slash + path
+    
+    if not (_NETLOC_CHARS.issuperset(netloc)
+            and _PATH_CHARS.issuperset(path)
+            and _QUERY_CHARS.issuperset(query)):
+        return None
+    
+    domain = netloc.replace('www.', '')
+    if not domain:
+        return None
+    
+    # Mirror parse_qs + urlencode: skip blank values, group repeated keys
+    params: Dict[str, List[str]] = {}
+    for field in query.split('&'):
+        name, _, value = field.partition('=')
+        if not value:
+            continue
+        if '=' in value:
+            return None  # urlencode would escape it
+        if name not in _TRACKING_PARAMS:
+            params.setdefault(name, []).append(value)
+    
+    normalized = domain + path.rstrip('/')
+    if params:
+        normalized += '?' + '&'.join(
+            f"{name}={value}" for name, values in params.items() for value in values
+        )
+    
+    return normalized.strip('/')
+
 
 class NewsDeduplicator:
     """
@@ -26,8 +157,8 @@ class NewsDeduplicator:
         self.similarity_threshold = similarity_threshold
         self.seen_urls: Set[str] = set()
         self.seen_titles: Set[str] = set()
-        self.seen_hashes: Set[str] = set()
-        self.title_list: List[str] = []  # For fuzzy matching
+        self.seen_hashes: Set[bytes] = set()
+        self.title_buckets: Dict[int, List[str]] = {}  # For fuzzy matching, keyed by length bucket
         
     def deduplicate(self, articles: List[Dict]) -> List[Dict]:
         """
@@ -46,28 +177,41 @@ class NewsDeduplicator:
         self.seen_urls = set()
         self.seen_titles = set()
         self.seen_hashes = set()
-        self.title_list = []
+        self.title_buckets = {}
         
         unique_articles = []
         
         # Sort by source priority (NewsAPI > Google News > ChatGPT)
-        source_priority = {'NewsAPI': 1, 'Google News': 2, 'ChatGPT': 3}
         sorted_articles = sorted(
             articles, 
-            key=lambda x: source_priority.get(x.get('fetched_from', ''), 4)
+            key=lambda x: _SOURCE_PRIORITY.get(x.get('fetched_from', ''), 4)
         )
         
         for article in sorted_articles:
-            if self._is_unique(article):
+            prepared = self._prepare(article)
+            if self._is_unique(article, prepared):
                 unique_articles.append(article)
-                self._mark_as_seen(article)
+                self._mark_as_seen(prepared)
         
         # Sort by date (newest first)
         unique_articles = self._sort_by_date(unique_articles)
         
         return unique_articles
     
-    def _is_unique(self, article: Dict) -> bool:
+    def _prepare(self, article: Dict) -> Tuple[str, str, bytes]:
+        """
+        Compute the comparison keys for an article once.
+        
+        Returns:
+            Tuple of (normalized URL, normalized title, content hash)
+        """
+        url = article.get('url', '')
+        normalized_url = normalize_url(url) if url else ''
+        normalized_title = self._normalize_text(article.get('title', ''))
+        content_hash = self._generate_content_hash(article, normalized_title)
+        return normalized_url, normalized_title, content_hash
+    
+    def _is_unique(self, article: Dict, prepared: Tuple[str, str, bytes]) -> bool:
         """
         Check if article is unique using multiple strategies.
         
@@ -82,103 +226,44 @@ class NewsDeduplicator:
         if not title or len(title) < 10:
             return False
         
+        normalized_url, normalized_title, content_hash = prepared
+        
         # Strategy 1: URL Check
-        url = article.get('url', '')
-        if url:
-            normalized_url = self._normalize_url(url)
-            if normalized_url and normalized_url in self.seen_urls:
-                return False
+        if normalized_url and normalized_url in self.seen_urls:
+            return False
         
         # Strategy 2: Exact Title Check
-        normalized_title = self._normalize_text(title)
         if normalized_title and normalized_title in self.seen_titles:
             return False
         
         # Strategy 3: Content Hash Check
-        content_hash = self._generate_content_hash(article)
         if content_hash in self.seen_hashes:
             return False
         
         # Strategy 4: Fuzzy Title Matching
-        if self._has_similar_title(title):
+        if self._has_similar_title(normalized_title):
             return False
         
         return True
     
-    def _mark_as_seen(self, article: Dict):
+    def _mark_as_seen(self, prepared: Tuple[str, str, bytes]):
         """Mark article identifiers as seen."""
+        normalized_url, normalized_title, content_hash = prepared
+        
         # Add normalized URL
-        url = article.get('url', '')
-        if url:
-            normalized_url = self._normalize_url(url)
-            if normalized_url:
-                self.seen_urls.add(normalized_url)
+        if normalized_url:
+            self.seen_urls.add(normalized_url)
         
         # Add normalized title
-        title = article.get('title', '')
-        normalized_title = self._normalize_text(title)
         if normalized_title:
             self.seen_titles.add(normalized_title)
-            self.title_list.append(normalized_title)
+            self.title_buckets.setdefault(
+                len(normalized_title) // _TITLE_BUCKET_WIDTH, []
+            ).append(normalized_title)
         
         # Add content hash
-        content_hash = self._generate_content_hash(article)
         self.seen_hashes.add(content_hash)
     
-    def _normalize_url(self, url: str) -> str:
-        """
-        Normalize URL to catch duplicates with different tracking parameters.
-        
-        Removes:
-        - Tracking parameters (utm_*, fbclid, etc.)
-        - Protocol differences (http vs https)
-        - Trailing slashes
-        - www prefix variations
-        """
-        if not url:
-            return ""
-        
-        try:
-            # Parse URL
-            parsed = urlparse(url.lower().strip())
-            
-            # Remove tracking parameters
-            tracking_params = {
-                'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content',
-                'fbclid', 'gclid', 'msclkid', 'ref', 'source', 'mc_cid', 'mc_eid',
-                '_ga', '_gl', 'ncid', 'sr_share', 'ocid', 'cvid', 'ei', 'oref'
-            }
-            
-            query_params = parse_qs(parsed.query)
-            filtered_params = {
-                k: v for k, v in query_params.items() 
-                if k.lower() not in tracking_params
-            }
-            
-            # Reconstruct URL
-            clean_query = urlencode(filtered_params, doseq=True) if filtered_params else ''
-            
-            # Normalize domain (remove www.)
-            domain = parsed.netloc.replace('www.', '')
-            
-            # Remove trailing slash from path
-            path = parsed.path.rstrip('/')
-            
-            # Reconstruct normalized URL
-            normalized = urlunparse((
-                '',  # No protocol
-                domain,
-                path,
-                '',
-                clean_query,
-                ''  # No fragment
-            ))
-            
-            return normalized.strip('/')
-            
-        except Exception:
-            return url.lower().strip()
-    
     def _normalize_text(self, text: str) -> str:
         """Normalize text for comparison."""
         if not text:
@@ -188,53 +273,87 @@ class NewsDeduplicator:
         text = text.lower()
         
         # Remove special characters and extra whitespace
-        text = re.sub(r'[^\w\s]', '', text)
-        text = re.sub(r'\s+', ' ', text)
+        text = _NON_WORD_RE.sub('', text)
+        text = _WHITESPACE_RE.sub(' ', text)
         
         return text.strip()
     
-    def _generate_content_hash(self, article: Dict) -> str:
+    def _generate_content_hash(self, article: Dict, normalized_title: str) -> bytes:
         """Generate a hash based on article content."""
-        # Combine key fields
-        title = article.get('title', '')
-        description = article.get('description', '')
-        content = f"{title}{description}"
-        normalized = self._normalize_text(content)
+        # Equality fingerprint only, so a fast 128-bit BLAKE2b digest is enough
+        content_hash = hashlib.blake2b(digest_size=16)
         
-        # Generate MD5 hash
-        return hashlib.md5(normalized.encode()).hexdigest()
+        # Feed key fields incrementally; the title is already normalized
+        content_hash.update(normalized_title.encode())
+        content_hash.update(self._normalize_text(article.get('description', '')).encode())
+        
+        return content_hash.digest()
     
-    def _has_similar_title(self, title: str) -> bool:
-        """Check if a similar title already exists using fuzzy matching."""
-        if not title:
+    def _has_similar_title(self, normalized_new: str) -> bool:
+        """Check if a similar (already normalized) title exists using fuzzy matching."""
+        if len(normalized_new) < 20:
+            return False  # Skip very short titles for fuzzy matching
+        
+        candidates = self._candidate_titles(len(normalized_new))
+        if not candidates:
             return False
         
-        normalized_new = self._normalize_text(title)
+        if process:
+            # Candidates already passed the 50% length cutoff; score them all
+            # in a single C++ call
+            match = process.extractOne(
+                normalized_new, candidates,
+                scorer=fuzz.ratio,
+                score_cutoff=self.similarity_threshold * 100
+            )
+            return match is not None
         
-        if len(normalized_new) < 20:
-            return False  # Skip very short titles for fuzzy matching
+        # difflib fallback: reuse one matcher with the new title as seq1 (same
+        # orientation as before); autojunk would skew scores for long titles.
+        matcher = SequenceMatcher(None, autojunk=False)
+        matcher.set_seq1(normalized_new)
         
-        for seen_title in self.title_list:
-            # Quick length check first
-            if abs(len(normalized_new) - len(seen_title)) > len(normalized_new) * 0.5:
+        for seen_title in candidates:
+            matcher.set_seq2(seen_title)
+            # Cheap upper bounds first; ratio() is the expensive call
+            if matcher.real_quick_ratio() < self.similarity_threshold:
                 continue
-                
-            similarity = SequenceMatcher(None, normalized_new, seen_title).ratio()
-            if similarity >= self.similarity_threshold:
+            if matcher.quick_ratio() < self.similarity_threshold:
+                continue
+            if matcher.ratio() >= self.similarity_threshold:
                 return True
         
         return False
     
+    def _candidate_titles(self, length: int) -> List[str]:
+        """Collect seen titles whose length is within the fuzzy-matching window."""
+        # Honor the 50% length cutoff; both scorers are also bounded by
+        # 2 * min(a, b) / (a + b), so titles outside that window can never match
+        # (the epsilon keeps exact-threshold lengths despite float rounding).
+        min_len = length * 0.5
+        max_len = length * 1.5
+        threshold = self.similarity_threshold
+        if 0 < threshold < 2:
+            min_len = max(min_len, length * threshold / (2 - threshold) - 1e-9)
+            max_len = min(max_len, length * (2 - threshold) / threshold + 1e-9)
+        
+        # Buckets are coarser than the window, so check exact lengths as well
+        candidates: List[str] = []
+        for bucket in range(int(min_len) // _TITLE_BUCKET_WIDTH, int(max_len) // _TITLE_BUCKET_WIDTH + 1):
+            candidates.extend(
+                title for title in self.title_buckets.get(bucket, ())
+                if min_len <= len(title) <= max_len
+            )
+        return candidates
+    
     def _sort_by_date(self, articles: List[Dict]) -> List[Dict]:
         """Sort articles by publication date (newest first)."""
-        def parse_date(article):
-            date_str = article.get('published_at', '')
-            if not date_str:
-                return ''
-            # Return as-is for string comparison (ISO format sorts correctly)
-            return date_str
-        
-        return sorted(articles, key=parse_date, reverse=True)
+        # Compare as strings (ISO format sorts correctly); missing dates sort last
+        return sorted(
+            articles,
+            key=lambda x: x.get('published_at') or '',
+            reverse=True
+        )
     
     def get_stats(self) -> Dict:
         """Return deduplication statistics."""
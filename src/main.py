@@ -5,6 +5,7 @@ Fetches news from multiple APIs, deduplicates, and sends via WhatsApp.
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from dotenv import load_dotenv
 
@@ -44,32 +45,29 @@ def main():
     # ========== FETCH NEWS FROM ALL SOURCES ==========
     all_articles = []
     
-    # 1. Fetch from NewsAPI
-    print("\n📡 Fetching from NewsAPI...")
-    try:
-        newsapi_articles = newsapi_fetcher.fetch_news(days_back=DAYS_BACK)
-        print(f"   ✅ Found {len(newsapi_articles)} articles")
-        all_articles.extend(newsapi_articles)
-    except Exception as e:
-        print(f"   ❌ NewsAPI error: {str(e)}")
-    
-    # 2. Fetch from Google News (via SerpAPI)
-    print("\n📡 Fetching from Google News...")
-    try:
-        google_articles = google_fetcher.fetch_news(days_back=DAYS_BACK)
-        print(f"   ✅ Found {len(google_articles)} articles")
-        all_articles.extend(google_articles)
-    except Exception as e:
-        print(f"   ❌ Google News error: {str(e)}")
-    
-    # 3. Fetch from ChatGPT
-    print("\n🤖 Fetching from ChatGPT...")
-    try:
-        chatgpt_articles = chatgpt_fetcher.fetch_news(days_back=DAYS_BACK)
-        print(f"   ✅ Found {len(chatgpt_articles)} articles")
-        all_articles.extend(chatgpt_articles)
-    except Exception as e:
-        print(f"   ❌ ChatGPT error: {str(e)}")
+    # (label, icon, fetcher) - NewsAPI, Google News (via SerpAPI), ChatGPT
+    sources = [
+        ("NewsAPI", "📡", newsapi_fetcher),
+        ("Google News", "📡", google_fetcher),
+        ("ChatGPT", "🤖", chatgpt_fetcher),
+    ]
+    
+    # Sources are independent network calls, so fetch them concurrently
+    print("\n📡 Fetching from all sources...")
+    with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+        futures = [
+            executor.submit(fetcher.fetch_news, days_back=DAYS_BACK)
+            for _, _, fetcher in sources
+        ]
+    
+    for (label, icon, _), future in zip(sources, futures):
+        print(f"\n{icon} Results from {label}...")
+        try:
+            articles = future.result()
+            print(f"   ✅ Found {len(articles)} articles")
+            all_articles.extend(articles)
+        except Exception as e:
+            print(f"   ❌ {label} error: {str(e)}")
     
     print(f"\n📊 Total articles before deduplication: {len(all_articles)}")
     
@@ -0,0 +1,27 @@
+"""
+Shared HTTP session setup for the API-backed news fetchers.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Upper bound on concurrent requests per fetcher
+MAX_WORKERS = 8
+
+
+def make_session() -> requests.Session:
+    """Create a session that reuses connections and retries transient connection and 5xx errors."""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=MAX_WORKERS,
+        max_retries=Retry(
+            total=3,
+            read=False,
+            backoff_factor=0.3,
+            status_forcelist=(500, 502, 503, 504),
+            raise_on_status=False
+        )
+    ))
+    return session
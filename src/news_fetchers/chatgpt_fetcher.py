@@ -12,6 +12,11 @@ try:
 except ImportError:
     OpenAI = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class ChatGPTFetcher:
     """Use ChatGPT to find and analyze electricity meter news."""
@@ -99,10 +104,11 @@ If you don't have recent information, return: {{"articles": []}}
             
             # Parse JSON response
             try:
-                parsed = json.loads(content)
+                # orjson.JSONDecodeError subclasses json.JSONDecodeError
+                parsed = orjson.loads(content) if orjson else json.loads(content)
                 articles = parsed.get('articles', [])
                 
-                return [self._standardize_article(a) for a in articles if self._standardize_article(a)]
+                return [standardized for a in articles if (standardized := self._standardize_article(a))]
                 
             except json.JSONDecodeError as e:
                 print(f"   ⚠️  ChatGPT returned invalid JSON: {str(e)}")
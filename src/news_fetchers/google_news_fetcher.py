@@ -4,9 +4,18 @@ Google News fetcher using SerpAPI.
 
 import os
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import List, Dict
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from deduplicator import normalize_url
+from ._http import MAX_WORKERS, make_session
+
 
 class GoogleNewsFetcher:
     """Fetch news from Google News using SerpAPI"""
@@ -15,6 +24,8 @@ class GoogleNewsFetcher:
         self.api_key = os.getenv("SERPAPI_KEY")
         self.base_url = "https://serpapi.com/search"
         
+        self.session = make_session()
+        
     def fetch_news(self, days_back: int = 2) -> List[Dict]:
         """
         Fetch electricity meters news from Google News for MEA region.
@@ -53,25 +64,42 @@ class GoogleNewsFetcher:
         all_articles = []
         seen_urls = set()
         
-        for query in search_queries:
-            for config in country_configs[:3]:  # Limit to avoid rate limits
-                try:
-                    params = {
+        # Limit countries to avoid rate limits
+        searches = [
+            (query, config)
+            for query in search_queries
+            for config in country_configs[:3]
+        ]
+        
+        # Issue all searches concurrently; responses are handled in order
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(searches))) as executor:
+            futures = [
+                executor.submit(
+                    self.session.get,
+                    self.base_url,
+                    params={
                         'engine': 'google_news',
                         'q': query,
                         'gl': config['gl'],
                         'hl': 'en',
                         'api_key': self.api_key
-                    }
-                    
-                    response = requests.get(self.base_url, params=params, timeout=15)
+                    },
+                    timeout=15
+                )
+                for query, config in searches
+            ]
+            
+            for (query, _), future in zip(searches, futures):
+                try:
+                    response = future.result()
                     
                     if response.status_code == 200:
-                        data = response.json()
+                        data = orjson.loads(response.content) if orjson else response.json()
                         news_results = data.get('news_results', [])
                         
                         for article in news_results:
-                            url = article.get('link', '')
+                            # Key on the normalized URL so tracking/slash variants collapse
+                            url = normalize_url(article.get('link', ''))
                             if url and url not in seen_urls:
                                 standardized = self._standardize_article(article, days_back)
                                 if standardized:
@@ -80,6 +108,8 @@ class GoogleNewsFetcher:
                                     
                     elif response.status_code == 401:
                         print(f"   ❌ SerpAPI authentication failed. Check API key.")
+                        for pending in futures:
+                            pending.cancel()
                         return all_articles
                     else:
                         print(f"   ⚠️  SerpAPI error: {response.status_code}")
@@ -4,9 +4,18 @@ NewsAPI.org fetcher for electricity meters news.
 
 import os
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import List, Dict
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from deduplicator import normalize_url
+from ._http import MAX_WORKERS, make_session
+
 
 class NewsAPIFetcher:
     """Fetch news from NewsAPI.org"""
@@ -15,6 +24,8 @@ class NewsAPIFetcher:
         self.api_key = os.getenv("NEWSAPI_KEY")
         self.base_url = "https://newsapi.org/v2/everything"
         
+        self.session = make_session()
+        
     def fetch_news(self, days_back: int = 2) -> List[Dict]:
         """
         Fetch electricity meters news for MEA region.
@@ -34,62 +45,78 @@ class NewsAPIFetcher:
         from_date = (today - timedelta(days=days_back)).strftime('%Y-%m-%d')
         to_date = today.strftime('%Y-%m-%d')
         
-        # Search queries for comprehensive coverage
+        # Search queries for comprehensive coverage. NewsAPI supports boolean
+        # operators, so topics are OR-ed together and scoped to the MEA region
+        # in one request each instead of one request per keyword combination.
+        region = (
+            '("Middle East" OR Africa OR UAE OR Saudi OR Nigeria OR Egypt '
+            'OR Morocco OR Kenya)'
+        )
         search_queries = [
-            'electricity meter Middle East',
-            'smart meter Africa',
-            'electricity metering UAE Saudi',
-            'smart grid Africa',
-            'utility meter Nigeria South Africa',
-            'prepaid electricity meter Africa',
-            'AMI metering Middle East',
-            'electricity meter Egypt Morocco Kenya'
+            '("electricity meter" OR "smart meter" OR "prepaid meter" '
+            f'OR "utility meter" OR metering OR AMI) AND {region}',
+            f'"smart grid" AND {region}'
         ]
         
         all_articles = []
         seen_urls = set()
         
-        for query in search_queries:
-            try:
-                params = {
-                    'q': query,
-                    'from': from_date,
-                    'to': to_date,
-                    'language': 'en',
-                    'sortBy': 'publishedAt',
-                    'pageSize': 20,
-                    'apiKey': self.api_key
-                }
-                
-                response = requests.get(self.base_url, params=params, timeout=10)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    articles = data.get('articles', [])
-                    
-                    for article in articles:
-                        url = article.get('url', '')
-                        if url and url not in seen_urls:
-                            standardized = self._standardize_article(article)
-                            if standardized:
-                                all_articles.append(standardized)
-                                seen_urls.add(url)
-                                
-                elif response.status_code == 401:
-                    print(f"   ❌ NewsAPI authentication failed. Check API key.")
-                    break
-                elif response.status_code == 429:
-                    print(f"   ⚠️  NewsAPI rate limit reached.")
-                    break
-                else:
-                    print(f"   ⚠️  NewsAPI error for '{query}': {response.status_code}")
+        # Issue all queries concurrently; responses are handled in query order
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(search_queries))) as executor:
+            futures = [
+                executor.submit(
+                    self.session.get,
+                    self.base_url,
+                    params={
+                        'q': query,
+                        'from': from_date,
+                        'to': to_date,
+                        'language': 'en',
+                        'sortBy': 'publishedAt',
+                        'pageSize': 100,
+                        'apiKey': self.api_key
+                    },
+                    timeout=10
+                )
+                for query in search_queries
+            ]
+            
+            for query, future in zip(search_queries, futures):
+                try:
+                    response = future.result()
                     
-            except requests.exceptions.Timeout:
-                print(f"   ⚠️  NewsAPI timeout for '{query}'")
-                continue
-            except Exception as e:
-                print(f"   ❌ NewsAPI exception for '{query}': {str(e)}")
-                continue
+                    if response.status_code == 200:
+                        data = orjson.loads(response.content) if orjson else response.json()
+                        articles = data.get('articles', [])
+                        
+                        for article in articles:
+                            # Key on the normalized URL so tracking/slash variants collapse
+                            url = normalize_url(article.get('url', ''))
+                            if url and url not in seen_urls:
+                                standardized = self._standardize_article(article)
+                                if standardized:
+                                    all_articles.append(standardized)
+                                    seen_urls.add(url)
+                                    
+                    elif response.status_code == 401:
+                        print(f"   ❌ NewsAPI authentication failed. Check API key.")
+                        for pending in futures:
+                            pending.cancel()
+                        break
+                    elif response.status_code == 429:
+                        print(f"   ⚠️  NewsAPI rate limit reached.")
+                        for pending in futures:
+                            pending.cancel()
+                        break
+                    else:
+                        print(f"   ⚠️  NewsAPI error for '{query}': {response.status_code}")
+                        
+                except requests.exceptions.Timeout:
+                    print(f"   ⚠️  NewsAPI timeout for '{query}'")
+                    continue
+                except Exception as e:
+                    print(f"   ❌ NewsAPI exception for '{query}': {str(e)}")
+                    continue
         
         return all_articles
     
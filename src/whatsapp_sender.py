@@ -14,13 +14,96 @@ Optional:
 """
 
 import os
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+import random
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from functools import lru_cache
+from typing import List, Dict, Any, NamedTuple, Optional, Tuple
 
-try:
-    from twilio.rest import Client
-except Exception:  # pragma: no cover
-    Client = None
+# Twilio SDK client class, imported on first use so callers that only format
+# messages don't pay for it. None = not tried yet, False = import failed.
+_Client = None
+
+
+def _twilio_client_class():
+    global _Client
+    if _Client is None:
+        try:
+            from twilio.rest import Client as _Client
+        except Exception:  # pragma: no cover
+            _Client = False
+    return _Client
+
+
+# Upper bound on recipients messaged concurrently
+MAX_SEND_WORKERS = 8
+
+# Tries per message. Only statuses where Twilio did not accept the message are
+# retried, so a retry can never deliver a duplicate.
+SEND_ATTEMPTS = 4
+_RETRYABLE_STATUSES = frozenset({429, 503})
+
+# YYYY-MM-DDTHH:MM[:SS[.ffffff]][Z|+HH:MM]; groups are the date and HH:MM
+_ISO_TIMESTAMP_RE = re.compile(
+    r"(\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\d|3[01]))"
+    r"T((?:[01]\d|2[0-3]):[0-5]\d)"
+    r"(?::[0-5]\d(?:\.\d{1,6})?)?"
+    r"(?:Z|[+-](?:[01]\d|2[0-3]):[0-5]\d)?"
+)
+
+# Per-field caps so one malformed article can't produce an unsplittable line;
+# URLs are never clipped (a cut link is dead), over-long ones are dropped instead
+_MAX_TITLE = 200
+_MAX_URL = 400
+_MAX_META = 120
+
+# Control characters: whitespace ones become spaces, the rest are dropped
+_CONTROL_CHARS = {c: None for c in [*range(0x20), 0x7F]}
+_CONTROL_CHARS.update(dict.fromkeys(map(ord, "\t\n\r\x0b\x0c"), " "))
+
+# Digest header; only the timestamp changes between runs
+_HEADER_TEMPLATE = "Electricity Meters & Grid News Digest\nGenerated: {now}\n"
+
+
+@lru_cache(maxsize=1024)
+def _format_date_cached(s: str) -> str:
+    """Memoized body of WhatsAppSender._format_date; articles often share timestamps."""
+    s = (s or "").strip()
+    if not s:
+        return ""
+    # Fast path for the common ISO 8601 / RFC 3339 timestamp: the output is
+    # just the date and HH:MM, so slice them out without a full parse. The
+    # regex only checks the date's shape; impossible dates (2024-02-30) fall
+    # through so they are kept unchanged, as before.
+    match = _ISO_TIMESTAMP_RE.fullmatch(s)
+    if match:
+        try:
+            date.fromisoformat(match.group(1))
+            return f"{match.group(1)} {match.group(2)}"
+        except ValueError:
+            pass
+    # Keep original if parsing fails; avoids hard dependency.
+    try:
+        # Other formats: date only, space separator, etc.
+        dt = datetime.fromisoformat(s[:-1] + "+00:00" if s.endswith("Z") else s)
+        return dt.strftime("%Y-%m-%d %H:%M")
+    except Exception:
+        return s
+
+
+class _SendDetail(NamedTuple):
+    """Outcome of one Twilio message; converted to a dict only for the result."""
+    to: str
+    sid: Optional[str]
+    chunk: int
+    error: Optional[str] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        if self.error is None:
+            return {"to": self.to, "sid": self.sid, "chunk": self.chunk}
+        return {"to": self.to, "error": self.error, "chunk": self.chunk}
 
 
 class WhatsAppSender:
@@ -31,9 +114,45 @@ class WhatsAppSender:
         self.recipients_raw = os.getenv("WHATSAPP_PHONE_NUMBERS", "").strip()
         self.max_chars = int(os.getenv("WHATSAPP_MAX_CHARS_PER_MSG", "1400"))
 
-        self._client = None
-        if self.account_sid and self.auth_token and Client:
-            self._client = Client(self.account_sid, self.auth_token)
+        # Addresses don't change after construction; parse them once.
+        self._from_addr = self._to_whatsapp_addr(self.from_number)
+        self._recipients_cached = tuple(
+            self._to_whatsapp_addr(p.strip()) for p in self.recipients_raw.split(",") if p.strip()
+        )
+
+        # One pooled session for all sends; Twilio clients are created per worker
+        self._session = None
+        if self.account_sid and self.auth_token and _twilio_client_class():
+            self._session = self._build_session()
+
+    @staticmethod
+    def _build_session():
+        """Keep-alive requests session with a connection pool sized for concurrent sends."""
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        # Only connection failures are retried: a POST that reached Twilio is
+        # never replayed, so a message cannot be delivered twice.
+        session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=MAX_SEND_WORKERS,
+            max_retries=Retry(total=3, backoff_factor=0.2)
+        ))
+        return session
+
+    def _new_client(self):
+        """Twilio client whose HTTP wrapper sends through the shared pooled session.
+
+        TwilioHttpClient keeps the last response on the instance, so a client
+        must not be used from several threads at once; the session can be.
+        """
+        from twilio.http.http_client import TwilioHttpClient
+
+        http_client = TwilioHttpClient(pool_connections=False)
+        http_client.session = self._session
+        return _Client(self.account_sid, self.auth_token, http_client=http_client)
 
     @staticmethod
     def _to_whatsapp_addr(number: str) -> str:
@@ -44,68 +163,56 @@ class WhatsAppSender:
             return number
         return f"whatsapp:{number}"
 
-    def _recipients(self) -> List[str]:
-        if not self.recipients_raw:
-            return []
-        parts = [p.strip() for p in self.recipients_raw.split(",") if p.strip()]
-        return [self._to_whatsapp_addr(p) for p in parts if p]
+    def _recipients(self) -> Tuple[str, ...]:
+        return self._recipients_cached
 
     @staticmethod
     def _safe(s: Any) -> str:
-        return (str(s) if s is not None else "").strip()
+        return (str(s) if s is not None else "").translate(_CONTROL_CHARS).strip()
+
+    @staticmethod
+    def _clip(s: str, limit: int) -> str:
+        return s if len(s) <= limit else s[: limit - 1].rstrip() + "…"
 
     @staticmethod
     def _format_date(s: str) -> str:
         """Best-effort normalization of published_at."""
-        s = (s or "").strip()
-        if not s:
-            return ""
-        # Keep original if parsing fails; avoids hard dependency.
-        try:
-            # Common formats: ISO 8601 with Z, RFC 3339, etc.
-            dt = datetime.fromisoformat(s.replace("Z", "+00:00"))
-            return dt.strftime("%Y-%m-%d %H:%M")
-        except Exception:
-            return s
+        return _format_date_cached(s)
+
+    def _format_article(self, index: int, a: Dict) -> str:
+        """Format one digest entry: title, optional meta and URL lines, spacer."""
+        title = self._clip(self._safe(a.get("title", "Untitled")), _MAX_TITLE)
+        url = self._safe(a.get("url", ""))
+        if len(url) > _MAX_URL:
+            url = ""
+        source = self._safe(a.get("source", ""))
+        fetched_from = self._safe(a.get("fetched_from", ""))
+        published_at = self._format_date(self._safe(a.get("published_at", "")))
+
+        meta = self._clip(" | ".join(p for p in (source, fetched_from, published_at) if p), _MAX_META)
+
+        entry = f"{index}. {title}\n"
+        if meta:
+            entry += f"   {meta}\n"
+        if url:
+            entry += f"   {url}\n"
+        return entry  # trailing newline is the spacer
 
     def format_message(self, articles: List[Dict], analysis: str = "") -> str:
-        now = datetime.now().strftime("%Y-%m-%d %H:%M")
-        header = [
-            f"Electricity Meters & Grid News Digest",
-            f"Generated: {now}",
-            ""
-        ]
+        header = _HEADER_TEMPLATE.format(now=datetime.now().strftime("%Y-%m-%d %H:%M"))
 
         if not articles:
             body = ["No new news items found for the selected period."]
             if analysis:
                 body += ["", "AI Notes:", analysis.strip()]
-            return "\n".join(header + body).strip()
-
-        lines = []
-        for i, a in enumerate(articles, start=1):
-            title = self._safe(a.get("title", "Untitled"))
-            url = self._safe(a.get("url", ""))
-            source = self._safe(a.get("source", ""))
-            fetched_from = self._safe(a.get("fetched_from", ""))
-            published_at = self._format_date(self._safe(a.get("published_at", "")))
-
-            meta_parts = [p for p in [source, fetched_from, published_at] if p]
-            meta = " | ".join(meta_parts)
-
-            lines.append(f"{i}. {title}")
-            if meta:
-                lines.append(f"   {meta}")
-            if url:
-                lines.append(f"   {url}")
-            lines.append("")  # spacer
+            return "\n".join([header] + body).strip()
+
+        lines = [self._format_article(i, a) for i, a in enumerate(articles, start=1)]
 
         if analysis and analysis.strip():
-            lines.append("AI Notes:")
-            lines.append(analysis.strip())
-            lines.append("")
+            lines.append(f"AI Notes:\n{analysis.strip()}\n")
 
-        msg = "\n".join(header + lines).strip()
+        msg = "\n".join([header] + lines).strip()
         return msg
 
     def _split_message(self, message: str) -> List[str]:
@@ -113,23 +220,20 @@ class WhatsAppSender:
         if len(message) <= self.max_chars:
             return [message]
 
+        # Split by lines first to keep readability. Each chunk ends at the last
+        # "\n" that keeps it within max_chars, found with one rfind() per chunk
+        # instead of materializing every line. The appended "\n" terminates the
+        # final line so every line has a break to cut at.
+        text = message + "\n"
         chunks: List[str] = []
-        current: List[str] = []
-        current_len = 0
-
-        # Split by lines first to keep readability.
-        for line in message.splitlines():
-            add_len = len(line) + 1  # + newline
-            if current and (current_len + add_len) > self.max_chars:
-                chunks.append("\n".join(current).strip())
-                current = [line]
-                current_len = len(line) + 1
-            else:
-                current.append(line)
-                current_len += add_len
-
-        if current:
-            chunks.append("\n".join(current).strip())
+        offset = 0
+        while offset < len(text):
+            cut = text.rfind("\n", offset, offset + self.max_chars)
+            if cut < 0:
+                # Overlong line: it becomes its own chunk.
+                cut = text.find("\n", offset)
+            chunks.append(text[offset:cut].strip())
+            offset = cut + 1
 
         # Safety: never return empty.
         return [c for c in chunks if c] or [message[: self.max_chars]]
@@ -140,7 +244,7 @@ class WhatsAppSender:
         if not recipients:
             return {"status": "skipped", "reason": "No WHATSAPP_PHONE_NUMBERS configured", "sent": 0}
 
-        if not self._client:
+        if self._session is None:
             missing = []
             if not self.account_sid:
                 missing.append("TWILIO_ACCOUNT_SID")
@@ -148,27 +252,57 @@ class WhatsAppSender:
                 missing.append("TWILIO_AUTH_TOKEN")
             if not self.from_number:
                 missing.append("TWILIO_WHATSAPP_NUMBER")
-            if not Client:
+            if not _twilio_client_class():
                 missing.append("twilio package import failed")
             return {"status": "skipped", "reason": f"Twilio not configured: {', '.join(missing)}", "sent": 0}
 
-        from_addr = self._to_whatsapp_addr(self.from_number)
+        from_addr = self._from_addr
         chunks = self._split_message(message)
 
-        results = {"status": "ok", "sent": 0, "details": []}
-
-        for to_addr in recipients:
-            for idx, chunk in enumerate(chunks, start=1):
-                try:
-                    msg = self._client.messages.create(
-                        from_=from_addr,
-                        to=to_addr,
-                        body=chunk if len(chunks) == 1 else f"({idx}/{len(chunks)})\n{chunk}"
-                    )
-                    results["sent"] += 1
-                    results["details"].append({"to": to_addr, "sid": getattr(msg, "sid", None), "chunk": idx})
-                except Exception as e:
-                    results["status"] = "partial_fail"
-                    results["details"].append({"to": to_addr, "error": str(e), "chunk": idx})
-
-        return results
+        # Prefix "(i/n)" only when the digest spans several messages; bodies
+        # are the same for every recipient, so build them once.
+        bodies = chunks if len(chunks) == 1 else [
+            f"({idx}/{len(chunks)})\n{chunk}" for idx, chunk in enumerate(chunks, start=1)
+        ]
+
+        # Recipients are independent, so send to them concurrently; chunks for
+        # one recipient stay sequential to keep the (i/n) parts in order.
+        with ThreadPoolExecutor(max_workers=min(MAX_SEND_WORKERS, len(recipients))) as executor:
+            per_recipient = list(executor.map(
+                lambda to_addr: self._send_chunks(from_addr, to_addr, bodies),
+                recipients
+            ))
+
+        details = [detail for recipient_details in per_recipient for detail in recipient_details]
+        sent = sum(1 for detail in details if detail.error is None)
+
+        return {
+            "status": "ok" if sent == len(details) else "partial_fail",
+            "sent": sent,
+            "details": [detail.as_dict() for detail in details],
+        }
+
+    def _send_chunks(self, from_addr: str, to_addr: str, bodies: List[str]) -> List[_SendDetail]:
+        """Send all message bodies to one recipient in order. Returns per-chunk details."""
+        # Runs in a worker thread, so it gets its own client (see _new_client)
+        client = self._new_client()
+        details: List[_SendDetail] = []
+        for i, body in enumerate(bodies, 1):
+            try:
+                msg = self._create_message(client, from_addr, to_addr, body)
+                details.append(_SendDetail(to_addr, getattr(msg, "sid", None), i))
+            except Exception as e:
+                details.append(_SendDetail(to_addr, None, i, str(e)))
+        return details
+
+    def _create_message(self, client, from_addr: str, to_addr: str, body: str):
+        """Create one Twilio message, retrying with jittered backoff on 429/503."""
+        for attempt in range(SEND_ATTEMPTS):
+            try:
+                return client.messages.create(from_=from_addr, to=to_addr, body=body)
+            except Exception as e:
+                # TwilioRestException carries the HTTP status; other errors don't.
+                if attempt + 1 < SEND_ATTEMPTS and getattr(e, "status", None) in _RETRYABLE_STATUSES:
+                    time.sleep(min(2 ** attempt + random.random() * 0.3, 8.0))
+                    continue
+                raise